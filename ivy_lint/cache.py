@@ -0,0 +1,234 @@
+"""
+On-disk cache of files known to be formatted.
+
+One small marker is kept per formatted file, in a directory per version of ivy-lint,
+black and Python so that any change to them invalidates all markers. The cache
+lives under ``$IVY_LINT_CACHE_DIR`` if set, else under ``$XDG_CACHE_HOME/ivy_lint``,
+and is disabled entirely by setting ``IVY_LINT_NO_CACHE``.
+"""
+
+import functools
+import hashlib
+import os
+import shutil
+import sys
+import time
+from typing import Optional
+
+import black
+
+# Directories of other versions untouched for this long are assumed abandoned
+CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+
+def _user_cache_dir() -> str:
+    """
+    Return the base directory for user cache files.
+
+    Follows the XDG Base Directory specification, which treats an empty or relative
+    `XDG_CACHE_HOME` as unset.
+
+    Returns
+    -------
+    The absolute path of the user cache directory.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    if not cache_home or not os.path.isabs(cache_home):
+        cache_home = os.path.expanduser("~/.cache")
+    return cache_home
+
+
+def _cache_root() -> str:
+    """
+    Return the directory holding the cache directories of all versions.
+
+    Returns
+    -------
+    The path of the cache root.
+    """
+    base = os.environ.get("IVY_LINT_CACHE_DIR") or os.path.join(
+        _user_cache_dir(), "ivy_lint"
+    )
+    # Only this subdirectory is ever pruned, so pointing `IVY_LINT_CACHE_DIR` at a
+    # shared directory is safe
+    return os.path.join(base, "ordering")
+
+
+def _version_key() -> str:
+    """
+    Return a key identifying the current versions of ivy-lint, black and Python.
+
+    The output of the formatters depends on the sources of this package, on black
+    and on the `ast` of the running interpreter, so all three are part of the key.
+
+    Returns
+    -------
+    The hex digest identifying the versions.
+    """
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.blake2b(
+        f"{sys.version_info[:2]}\0{black.__version__}\0".encode("utf-8"),
+        digest_size=8,
+    )
+    for root, dirs, files in os.walk(package_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if name.endswith(".py"):
+                with open(os.path.join(root, name), "rb") as f:
+                    digest.update(f.read())
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _cache_dir() -> Optional[str]:
+    """
+    Return the cache directory of the current versions.
+
+    Computed once per process, on first use, so runs with the cache disabled never
+    hash the package sources.
+
+    Returns
+    -------
+    The path of the cache directory, or None if the cache is disabled.
+    """
+    if os.environ.get("IVY_LINT_NO_CACHE"):
+        return None
+    return os.path.join(_cache_root(), _version_key())
+
+
+@functools.lru_cache(maxsize=None)
+def _touch_cache_dir() -> None:
+    """
+    Refresh the mtime of the cache directory once per process.
+
+    Cache hits and rewritten markers leave the directory mtime untouched, so this
+    keeps a version that is still in use from looking abandoned to `_prune`.
+    """
+    try:
+        os.utime(_cache_dir())
+    except OSError:
+        pass
+
+
+def _prune(cache_dir: str) -> None:
+    """
+    Remove unused cache directories of other versions.
+
+    Only directories untouched for longer than `CACHE_MAX_AGE` are removed. Recently
+    used ones may belong to another install sharing the cache, e.g. a hook pinned to
+    a different revision or running on a different Python version.
+
+    Parameters
+    ----------
+    cache_dir
+        The cache directory of the current versions, which is kept.
+    """
+    cache_root, current = os.path.split(cache_dir)
+    cutoff = time.time() - CACHE_MAX_AGE
+    for entry in os.listdir(cache_root):
+        if entry == current:
+            continue
+        path = os.path.join(cache_root, entry)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                shutil.rmtree(path, ignore_errors=True)
+        except OSError:
+            pass
+
+
+def _source_digest(source_code: str) -> str:
+    """
+    Return a hash of the given source code.
+
+    Parameters
+    ----------
+    source_code
+        The complete source code of a file.
+
+    Returns
+    -------
+    The hex digest of the source code.
+    """
+    return hashlib.blake2b(source_code.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _marker_path(cache_dir: str, filename: str) -> str:
+    """
+    Return the path of the cache marker for the given file.
+
+    Markers are keyed by the absolute path of the file and overwritten whenever it
+    changes, so the cache holds at most one marker per formatted file.
+
+    Parameters
+    ----------
+    cache_dir
+        The cache directory of the current versions.
+    filename
+        The path to the Python file.
+
+    Returns
+    -------
+    The path of the marker file inside `cache_dir`.
+    """
+    key = hashlib.blake2b(
+        os.path.abspath(filename).encode("utf-8"), digest_size=16
+    ).hexdigest()
+    return os.path.join(cache_dir, key)
+
+
+def is_marked_formatted(filename: str, source_code: str) -> bool:
+    """
+    Check whether a previous run confirmed that the given source code is formatted.
+
+    Parameters
+    ----------
+    filename
+        The path to the Python file.
+    source_code
+        The current source code of the file.
+
+    Returns
+    -------
+    True if the marker of the file holds the digest of the source code, False
+    otherwise or if the cache is disabled.
+    """
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return False
+    try:
+        with open(_marker_path(cache_dir, filename), "r", encoding="utf-8") as f:
+            if f.read() != _source_digest(source_code):
+                return False
+    except OSError:
+        return False
+    _touch_cache_dir()
+    return True
+
+
+def mark_formatted(filename: str, source_code: str) -> None:
+    """
+    Record that the given source code of a file is already formatted.
+
+    Creating the cache directory of new versions removes the directories of other
+    versions that went unused for a while. Failing to write the marker only disables
+    the cache, so errors are ignored.
+
+    Parameters
+    ----------
+    filename
+        The path to the Python file.
+    source_code
+        The source code of the file, which formatting left unchanged.
+    """
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return
+    try:
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir, exist_ok=True)
+            _prune(cache_dir)
+        with open(_marker_path(cache_dir, filename), "w", encoding="utf-8") as f:
+            f.write(_source_digest(source_code))
+        _touch_cache_dir()
+    except OSError:
+        pass
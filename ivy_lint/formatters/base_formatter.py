@@ -1,15 +1,41 @@
 """Base Ivy formatter."""
 
+import os
+import sys
 from abc import ABC, abstractmethod
 from typing import List
 
+# Limit of ProcessPoolExecutor on Windows, see `concurrent.futures.process`
+MAX_WINDOWS_WORKERS = 61
+
 
 class BaseFormatter(ABC):
     """Base formatter for ivy style."""
 
+    # Below this many files, spawning worker processes costs more than it saves
+    MIN_FILES_FOR_POOL = 8
+
     def __init__(self, filenames: List[str]) -> None:
         self.filenames = filenames
 
+    def __getstate__(self) -> dict:
+        """
+        Return the state to pickle, without the list of files.
+
+        The bound `_format_file` handed to the process pool is pickled with every
+        chunk, and workers only need the formatter configuration. This applies to
+        every pickled formatter: an unpickled instance has no `filenames`, so
+        calling `format` on it raises AttributeError.
+
+        Returns
+        -------
+        state
+            The instance attributes other than `filenames`.
+        """
+        state = self.__dict__.copy()
+        state.pop("filenames", None)
+        return state
+
     def format(self) -> bool:
         """
         Format docstrings in files.
@@ -19,12 +45,47 @@ class BaseFormatter(ABC):
         changed
             True if any file was changed, False otherwise.
         """
-        changed = False
+        filenames = [f for f in self.filenames if self._should_format(f)]
+
+        if hasattr(os, "sched_getaffinity"):
+            # Respect the CPUs this process is restricted to, e.g. by taskset
+            cpus = len(os.sched_getaffinity(0))
+        else:
+            cpus = os.cpu_count() or 1
+        workers = min(cpus, len(filenames))
+        if sys.platform == "win32":
+            # ProcessPoolExecutor rejects more workers than Windows can wait on
+            workers = min(workers, MAX_WINDOWS_WORKERS)
 
-        for filename in self.filenames:
-            changed = self._format_file(filename) or changed
+        if len(filenames) < self.MIN_FILES_FOR_POOL or workers < 2:
+            return any([self._format_file(filename) for filename in filenames])
 
-        return changed
+        # Files are formatted independently and the work is CPU-bound, so fan
+        # out across processes rather than threads.
+        # Batch files to cut inter-process overhead while still giving every
+        # worker several chunks to balance uneven file sizes
+        chunksize = max(1, len(filenames) // (workers * 4))
+        # Imported here since it pulls in multiprocessing, which the serial path
+        # does not need
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(self._format_file, filenames, chunksize=chunksize)
+            )
+
+        return any(results)
+
+    def _should_format(self, filename: str) -> bool:
+        """
+        Check whether a file is handled by this formatter.
+
+        Returns
+        -------
+        ret
+            True if the file should be passed to `_format_file`, False otherwise.
+        """
+        return True
 
     @abstractmethod
     def _format_file(self, filename: str) -> bool:
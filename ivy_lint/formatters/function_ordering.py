@@ -1,24 +1,80 @@
+import io
 import re
 import ast
-import networkx as nx
-from typing import Tuple, List
-import sys
+from collections import deque
+from typing import Dict, Set, Tuple, List
 
 import black
 
+from ivy_lint.cache import is_marked_formatted, mark_formatted
 from ivy_lint.formatters import BaseFormatter
 
+BLACK_MODE = black.Mode()
+HEADER_TITLES = ("Helpers", "Main", "API Functions")
 HEADER_PATTERN = re.compile(
-    r"#\s?(-{0,3})\s?(Helpers|Main|API"
-    r" Functions)\s?(-{0,3})\s?#\n#\s?(-{7,15})\s?#\n(?:\s*\n)*"
+    r"#\s?(-{0,3})\s?("
+    + "|".join(map(re.escape, HEADER_TITLES))
+    + r")\s?(-{0,3})\s?#\n#\s?(-{7,15})\s?#\n(?:\s*\n)*"
 )
+# Categories of top-level nodes, see `classify_node`
+(
+    IMPORT_NODE,
+    TRY_IMPORT_NODE,
+    ASSIGN_NODE,
+    CLASS_NODE,
+    HELPER_FUNCTION_NODE,
+    API_FUNCTION_NODE,
+    OTHER_NODE,
+) = range(7)
+SECTION_HEADERS = {
+    HELPER_FUNCTION_NODE: "\n\n# --- Helpers --- #\n# --------------- #\n\n",
+    API_FUNCTION_NODE: "\n\n# --- Main --- #\n# ------------ #\n",
+}
+# Literal prefixes of FILE_PATTERN, checked first to reject most paths cheaply
+FILE_PREFIXES = ("ivy/functional/frontends/", "ivy_tests/test_ivy/")
 FILE_PATTERN = re.compile(
     r"(ivy/functional/frontends/(?!.*(?:config\.py|__init__\.py)$).*"
     r"|ivy_tests/test_ivy/(?!.*(?:__init__\.py|conftest\.py|helpers/.*|test_frontends/config/.*$)).*)"
 )
 
 
-def class_build_dependency_graph(nodes_with_comments: List[Tuple[str, ast.AST]]) -> nx.DiGraph:
+def topological_sort(graph: Dict[str, List[str]]) -> List[str]:
+    """
+    Sort the nodes of a dependency graph so every node follows its predecessors.
+
+    This is Kahn's algorithm processed in first-in first-out order, so nodes that do
+    not depend on each other keep the order in which they were added to the graph.
+    Nodes that are part of a cycle are left out of the result.
+
+    Parameters
+    ----------
+    graph 
+        A mapping from every node to the list of nodes that depend on it.
+
+    Returns
+    -------
+    A list of the nodes in topological order.
+    """
+    in_degree = dict.fromkeys(graph, 0)
+    for successors in graph.values():
+        for successor in successors:
+            in_degree[successor] += 1
+
+    queue = deque(node for node, degree in in_degree.items() if degree == 0)
+    sorted_nodes = []
+    while queue:
+        node = queue.popleft()
+        sorted_nodes.append(node)
+        for successor in graph[node]:
+            in_degree[successor] -= 1
+            if in_degree[successor] == 0:
+                queue.append(successor)
+    return sorted_nodes
+
+
+def class_build_dependency_graph(
+    nodes_with_comments: List[Tuple[str, ast.AST]]
+) -> Dict[str, List[str]]:
     """
     Build a class dependency graph based on class inheritance relationships.
 
@@ -33,45 +89,28 @@ def class_build_dependency_graph(nodes_with_comments: List[Tuple[str, ast.AST]])
 
     Returns
     -------
-    A directed graph representing class dependencies.
+    A directed graph representing class dependencies, mapping every class to the
+    classes that inherit from it.
     """
-    graph = nx.DiGraph()
+    graph = {}
     for _, node in nodes_with_comments:
         if isinstance(node, ast.ClassDef):
-            graph.add_node(node.name)
+            graph.setdefault(node.name, [])
             for base in node.bases:
-                if isinstance(base, ast.Name) and base.id not in graph:
-                    graph.add_node(base.id)
                 if isinstance(base, ast.Name):
-                    graph.add_edge(base.id, node.name)
+                    subclasses = graph.setdefault(base.id, [])
+                    if node.name not in subclasses:
+                        subclasses.append(node.name)
     return graph
 
 
-def contains_any_name(code: str, names: List[str]) -> bool:
-    """
-    Check if the given code contains any of the specified names.
-
-    Parameters
-    ----------
-    code 
-        The code string to search for names in.
-    names 
-        A list of names to search for within the code.
-
-    Returns
-    -------
-    True if any of the names are found in the code; otherwise, False.
-    """
-    return any(name in code for name in names)
-
-
-def extract_names_from_assignment(node: ast.Assign) -> List[str]:
+def extract_names_from_assignment(node: ast.Assign) -> Set[str]:
     """
     Extract variable names from an assignment node in an Abstract Syntax Tree (AST).
 
-    This function takes an AST assignment node as input and recursively extracts
-    variable names (identifiers) assigned within it. The function returns a list
-    of the extracted variable names.
+    This function takes an AST assignment node as input and walks its value to extract
+    the variable names (identifiers) it references. The function returns the set of
+    extracted variable names.
 
     Parameters
     ----------
@@ -80,113 +119,96 @@ def extract_names_from_assignment(node: ast.Assign) -> List[str]:
 
     Returns
     -------
-    A list of variable names extracted from the assignment node.
+    A set of variable names extracted from the assignment node.
     """
-    names = []
-
-    def extract_names(node):
-        if isinstance(node, ast.Name):
-            names.append(node.id)
-        for child in ast.iter_child_nodes(node):
-            extract_names(child)
-
-    # Handle Python version differences
-    if sys.version_info < (3, 8):
-        values = node.values
-    else:
-        values = [node.value]
-
-    for value in values:
-        extract_names(value)
-
-    return names
+    return {n.id for n in ast.walk(node.value) if isinstance(n, ast.Name)}
 
 
-def assignment_build_dependency_graph(nodes_with_comments: List[Tuple[str, ast.AST]]) -> nx.DiGraph:
+def has_st_composite_decorator(node: ast.FunctionDef) -> bool:
     """
-    Build a directed graph to represent dependencies between variables in assignment statements.
+    Check if a given function definition has a 'composite' decorator.
 
-    This function processes a list of nodes with comments and analyzes assignment statements to create a directed graph.
-    The graph represents dependencies between variables, where an edge from variable A to variable B means
-    that variable A is assigned a value that depends on variable B.
+    This function examines the decorator list of a function definition node to determine if it contains a decorator
+    with the name 'composite'.
 
     Parameters
     ----------
-    nodes_with_comments 
-        A list of tuples containing source code and corresponding AST nodes.
+    node 
+        An Abstract Syntax Tree (AST) node representing a function definition.
 
     Returns
     -------
-    A directed graph (NetworkX DiGraph) that captures variable dependencies.
+    True if the 'composite' decorator is found in the decorator list; otherwise, False.
     """
-    graph = nx.DiGraph()
-
-    for code, node in nodes_with_comments:
-        if isinstance(node, ast.Assign):
-            for target in node.targets:
-                if isinstance(target, ast.Name):
-                    graph.add_node(target.id)
-
-    for code, node in nodes_with_comments:
-        if isinstance(node, ast.Assign):
-            right_side_names = extract_names_from_assignment(node)
-
-            for target in node.targets:
-                if isinstance(target, ast.Name):
-                    for name in right_side_names:
-                        if graph.has_node(name):
-                            graph.add_edge(name, target.id)
-    return graph
+    for decorator in node.decorator_list:
+        if isinstance(decorator, ast.Attribute) and decorator.attr == "composite":
+            return True
+    return False
 
 
-def has_st_composite_decorator(node: ast.FunctionDef) -> bool:
+def helper_function_references(
+    nodes_with_comments: List[Tuple[str, ast.AST]]
+) -> Dict[str, str]:
     """
-    Check if a given function definition has a 'composite' decorator.
+    Map the names referenced by helper functions or classes to the helper using them.
 
-    This function examines the decorator list of a function definition node to determine if it contains a decorator
-    with the name 'composite'.
+    Helpers are the functions and classes whose names start with an underscore. When
+    several helpers reference the same name, the first one in the source wins.
 
     Parameters
     ----------
-    node 
-        An Abstract Syntax Tree (AST) node representing a function definition.
+    nodes_with_comments 
+        A list of tuples, where each tuple contains a string of code and the
+        corresponding AST node with comments.
 
     Returns
     -------
-    True if the 'composite' decorator is found in the decorator list; otherwise, False.
+    A dictionary mapping each referenced name to the name of the related helper
+    function or class.
     """
-    return any(
-        isinstance(decorator, ast.Attribute) and decorator.attr == "composite"
-        for decorator in node.decorator_list
-    )
+    references = {}
+    for _, node in nodes_with_comments:
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef)) and node.name.startswith(
+            "_"
+        ):
+            # ast.walk is iterative, so deeply nested expressions cannot hit the
+            # recursion limit like an ast.NodeVisitor would
+            for n in ast.walk(node):
+                if isinstance(n, ast.Name):
+                    references.setdefault(n.id, node.name)
+    return references
 
 
-def related_helper_function(assignment_name: str, nodes_with_comments: List[Tuple[str, ast.AST]]) -> str:
+def classify_node(node: ast.AST) -> int:
     """
-    Find a related helper function or class based on the provided assignment_name.
-
-    This function iterates through a list of nodes with comments (as returned by
-    `_extract_all_nodes_with_comments` function) to find a related helper function or class
-    based on the provided `assignment_name`.
+    Classify a top-level node into one of the categories used for ordering.
 
     Parameters
     ----------
-    assignment_name 
-        The name of the assignment that you want to find a related helper function for.
-    nodes_with_comments 
-        A list of tuples, where each tuple contains a string of code and the corresponding AST node with comments.
+    node 
+        A top-level Abstract Syntax Tree (AST) node.
 
     Returns
     -------
-    The name of the related helper function or class if found, or None if none is found.
+    One of the `*_NODE` category constants. Functions whose names start with an
+    underscore or that have a 'composite' decorator are helper functions, all other
+    functions are API functions.
     """
-    for _, node in nodes_with_comments:
-        if isinstance(node, (ast.FunctionDef, ast.ClassDef)) and hasattr(node, "name"):
-            if node.name.startswith("_") and contains_any_name(
-                ast.dump(node), [assignment_name]
-            ):
-                return node.name
-    return None
+    if isinstance(node, (ast.Import, ast.ImportFrom)):
+        return IMPORT_NODE
+    if isinstance(node, ast.Assign):
+        return ASSIGN_NODE
+    if isinstance(node, ast.ClassDef):
+        return CLASS_NODE
+    if isinstance(node, ast.FunctionDef):
+        if node.name.startswith("_") or has_st_composite_decorator(node):
+            return HELPER_FUNCTION_NODE
+        return API_FUNCTION_NODE
+    if isinstance(node, ast.Try):
+        for n in node.body:
+            if isinstance(n, (ast.Import, ast.ImportFrom)):
+                return TRY_IMPORT_NODE
+    return OTHER_NODE
 
 
 def _is_assignment_target_an_attribute(node: ast.Assign) -> bool:
@@ -225,10 +247,16 @@ class FunctionOrderingFormatter(BaseFormatter):
         -------
         The source code with existing headers removed.
         """
+        # Every header names its section and ends with a line of at least 7 dashes,
+        # so files missing either can skip the regex scan entirely.
+        if "-------" not in source_code or not any(
+            title in source_code for title in HEADER_TITLES
+        ):
+            return source_code
         return HEADER_PATTERN.sub("", source_code)
 
     def _extract_node_with_leading_comments(
-        self, node: ast.AST, source_code: str
+        self, node: ast.AST, lines: List[str], is_comment_or_blank: List[bool]
     ) -> Tuple[str, ast.AST]:
         """
         Extracts the portion of the source code containing the leading comments of the provided node.
@@ -238,8 +266,11 @@ class FunctionOrderingFormatter(BaseFormatter):
         ----------
         node 
             The node for which the leading comments need to be extracted.
-        source_code 
-            The complete source code containing the specified node and comments.
+        lines 
+            The lines of the complete source code containing the specified node and
+            comments.
+        is_comment_or_blank 
+            For each line, whether it is blank or only contains a comment.
 
         Returns
         -------
@@ -261,20 +292,12 @@ class FunctionOrderingFormatter(BaseFormatter):
             start_line = node.lineno
 
         end_line = getattr(node, "end_lineno", node.lineno)
-        lines = source_code.splitlines()
-        extracted_lines = []
 
-        for line_num in range(start_line - 1, end_line):
-            extracted_lines.append(lines[line_num])
+        first_line = start_line - 1
+        while first_line > 0 and is_comment_or_blank[first_line - 1]:
+            first_line -= 1
 
-        for line_num in range(start_line - 2, -1, -1):
-            stripped = lines[line_num].strip()
-            if not stripped or stripped.startswith("#"):
-                extracted_lines.insert(0, lines[line_num])
-            else:
-                break
-
-        return "\n".join(extracted_lines), node
+        return "\n".join(lines[first_line:end_line]), node
 
     def _extract_all_nodes_with_comments(
         self, tree: ast.AST, source_code: str
@@ -296,8 +319,14 @@ class FunctionOrderingFormatter(BaseFormatter):
         A list of tuples containing extracted source code with leading comments
         and their corresponding AST nodes.
         """
+        lines = source_code.splitlines()
+        is_comment_or_blank = []
+        for line in lines:
+            stripped = line.strip()
+            is_comment_or_blank.append(not stripped or stripped.startswith("#"))
+
         return [
-            self._extract_node_with_leading_comments(node, source_code)
+            self._extract_node_with_leading_comments(node, lines, is_comment_or_blank)
             for node in tree.body
         ]
 
@@ -317,30 +346,45 @@ class FunctionOrderingFormatter(BaseFormatter):
         -------
         The reordered source code.
         """
+        original_source_code = source_code
         source_code = self._remove_existing_headers(source_code)
 
         tree = ast.parse(source_code)
         nodes_with_comments = self._extract_all_nodes_with_comments(tree, source_code)
 
-        # Dependency graph for class inheritance
-        class_dependency_graph = class_build_dependency_graph(nodes_with_comments)
-        sorted_classes = list(nx.topological_sort(class_dependency_graph))
-
-        # Dependency graph for assignments
-        assignment_dependency_graph = assignment_build_dependency_graph(
-            nodes_with_comments
-        )
-        dependent_assignments = set(assignment_dependency_graph.nodes()) - set(
-            assignment_dependency_graph.edges()
-        )
+        # Classify every node once, later passes compare these integer categories
+        # instead of repeating isinstance checks
+        nodes = [node for _, node in nodes_with_comments]
+        categories = [classify_node(node) for node in nodes]
+        node_categories = {id(node): c for node, c in zip(nodes, categories)}
+        assignment_nodes = [n for n, c in zip(nodes, categories) if c == ASSIGN_NODE]
+
+        # Dependency graph for class inheritance. Many files only contain functions,
+        # in which case it would be empty and can be skipped altogether.
+        class_positions = {}
+        if CLASS_NODE in categories:
+            class_dependency_graph = class_build_dependency_graph(nodes_with_comments)
+            class_positions = {
+                name: i
+                for i, name in enumerate(topological_sort(class_dependency_graph))
+            }
+
+        right_side_names_by_node = {
+            id(node): extract_names_from_assignment(node) for node in assignment_nodes
+        }
         all_assignments = {
             target.id
-            for code, node in nodes_with_comments
-            if isinstance(node, ast.Assign)
+            for node in assignment_nodes
             for target in node.targets
             if isinstance(target, ast.Name)
         }
-        all_assignments - dependent_assignments
+        # Lookups shared by every call to sort_key below
+        function_positions = {}
+        for i, (node, category) in enumerate(zip(nodes, categories)):
+            if category in (CLASS_NODE, HELPER_FUNCTION_NODE, API_FUNCTION_NODE):
+                function_positions.setdefault(node.name, i)
+        function_and_class_names = frozenset(function_positions)
+        helper_references = helper_function_references(nodes_with_comments)
 
         def _is_assignment_dependent_on_assignment(node: ast.Assign) -> bool:
             """
@@ -356,8 +400,8 @@ class FunctionOrderingFormatter(BaseFormatter):
             True if the assignment depends on other assignments; otherwise, False.
             """
             if isinstance(node, ast.Assign):
-                right_side_names = extract_names_from_assignment(node)
-                return any(name in right_side_names for name in all_assignments)
+                right_side_names = right_side_names_by_node[id(node)]
+                return not all_assignments.isdisjoint(right_side_names)
             return False
 
         def _is_assignment_dependent_on_function_or_class(node: ast.Assign) -> bool:
@@ -374,15 +418,8 @@ class FunctionOrderingFormatter(BaseFormatter):
             True if the assignment depends on functions or classes; otherwise, False.
             """
             if isinstance(node, ast.Assign):
-                right_side_names = extract_names_from_assignment(node)
-                function_and_class_names = [
-                    node.name
-                    for _, node in nodes_with_comments
-                    if isinstance(node, (ast.FunctionDef, ast.ClassDef))
-                ]
-                return any(
-                    name in right_side_names for name in function_and_class_names
-                )
+                right_side_names = right_side_names_by_node[id(node)]
+                return not function_and_class_names.isdisjoint(right_side_names)
             return False
 
         def sort_key(item: Tuple[str, ast.AST]) -> Tuple[float, int, str]:
@@ -417,32 +454,22 @@ class FunctionOrderingFormatter(BaseFormatter):
             - If a node does not match any of the above categories, it is sorted with the lowest priority (8).
             """
             node = item[1]
+            category = node_categories[id(node)]
 
-            if isinstance(node, (ast.Import, ast.ImportFrom)):
+            if category == IMPORT_NODE:
                 return (0, 0, getattr(node, "name", ""))
 
             # Handle the try-except blocks containing imports.
-            if isinstance(node, ast.Try):
-                for n in node.body:
-                    if isinstance(n, (ast.Import, ast.ImportFrom)):
-                        return (0, 1, getattr(n, "name", ""))
+            if category == TRY_IMPORT_NODE:
+                return (0, 1, "")
 
-            if isinstance(node, ast.Assign):
+            if category == ASSIGN_NODE:
                 targets = [t.id for t in node.targets if isinstance(t, ast.Name)]
                 target_str = ",".join(targets)
 
-                related_function = related_helper_function(
-                    target_str, nodes_with_comments
-                )
+                related_function = helper_references.get(target_str)
                 if related_function:
-                    function_position = [
-                        i
-                        for i, (_, n) in enumerate(nodes_with_comments)
-                        if isinstance(n, (ast.FunctionDef, ast.ClassDef))
-                        and hasattr(n, "name")
-                        and n.name == related_function
-                    ][0]
-                    return (6, function_position, target_str)
+                    return (6, function_positions[related_function], target_str)
 
                 if _is_assignment_target_an_attribute(node):
                     return (5.5, 0, target_str)
@@ -454,39 +481,34 @@ class FunctionOrderingFormatter(BaseFormatter):
                 else:
                     return (1, 0, target_str)
 
-            if isinstance(node, ast.ClassDef):
-                try:
-                    return (2, sorted_classes.index(node.name), node.name)
-                except ValueError:
-                    return (2, len(sorted_classes), node.name)
+            if category == CLASS_NODE:
+                return (
+                    2,
+                    class_positions.get(node.name, len(class_positions)),
+                    node.name,
+                )
 
-            if isinstance(node, ast.FunctionDef):
-                if node.name.startswith("_") or has_st_composite_decorator(node):
-                    return (4, 0, node.name)
-                else:
-                    return (5, 0, node.name)
+            if category == HELPER_FUNCTION_NODE:
+                return (4, 0, node.name)
+
+            if category == API_FUNCTION_NODE:
+                return (5, 0, node.name)
 
             return (8, 0, getattr(node, "name", ""))
 
         nodes_sorted = sorted(nodes_with_comments, key=sort_key)
-        reordered_code_list = []
+        buffer = io.StringIO()
 
         # Check and add module-level docstring
-        docstring_added = False
-        if (
-            isinstance(tree, ast.Module)
-            and tree.body
-            and isinstance(tree.body[0], ast.Expr)
-            and isinstance(tree.body[0].value, ast.Str)
-        ):
-            docstring = ast.get_docstring(tree, clean=False)
-            if docstring:
-                reordered_code_list.append(f'"""{docstring}"""')
-                docstring_added = True
+        docstring = ast.get_docstring(tree, clean=False)
+        docstring_node = None
+        if docstring:
+            buffer.write(f'"""{docstring}"""\n')
+            docstring_node = tree.body[0]
 
         has_helper_functions = any(
-            isinstance(node, ast.FunctionDef) and node.name.startswith("_")
-            for _, node in nodes_sorted
+            category == HELPER_FUNCTION_NODE and node.name.startswith("_")
+            for node, category in zip(nodes, categories)
         )
 
         prev_was_assignment = False
@@ -494,52 +516,65 @@ class FunctionOrderingFormatter(BaseFormatter):
 
         for code, node in nodes_sorted:
             # If the docstring was added at the beginning, skip the node
-            if (
-                docstring_added
-                and isinstance(node, ast.Expr)
-                and isinstance(node.value, ast.Str)
-            ):
+            if node is docstring_node:
                 continue
 
-            current_function_type = None
-            if isinstance(node, ast.FunctionDef):
-                if node.name.startswith("_") or has_st_composite_decorator(node):
-                    current_function_type = "helper"
-                    if last_function_type != "helper":
-                        reordered_code_list.append(
-                            "\n\n# --- Helpers --- #\n# --------------- #\n"
-                        )
-                else:
-                    current_function_type = "api"
-                    if last_function_type != "api" and has_helper_functions:
-                        reordered_code_list.append(
-                            "\n\n# --- Main --- #\n# ------------ #"
-                        )
-
-            last_function_type = current_function_type or last_function_type
+            category = node_categories[id(node)]
+            # Emit a section header whenever the kind of function changes
+            if category in SECTION_HEADERS and category != last_function_type:
+                if category == HELPER_FUNCTION_NODE or has_helper_functions:
+                    buffer.write(SECTION_HEADERS[category])
+                last_function_type = category
 
-            if isinstance(node, ast.Assign):
-                if prev_was_assignment:
-                    reordered_code_list.append(code.strip())
-                else:
-                    reordered_code_list.append(code)
+            if category == ASSIGN_NODE:
+                buffer.write(code.strip() if prev_was_assignment else code)
                 prev_was_assignment = True
             else:
-                reordered_code_list.append(code)
+                buffer.write(code)
                 prev_was_assignment = False
+            buffer.write("\n")
 
-        reordered_code = "\n".join(reordered_code_list).strip()
+        # Leading and trailing blank lines are normalised by black below, but an
+        # empty buffer (e.g. a comment-only file) still needs its newline since
+        # black leaves empty input empty.
+        reordered_code = buffer.getvalue()
         if not reordered_code.endswith("\n"):
             reordered_code += "\n"
 
-        reordered_code = black.format_str(reordered_code, mode=black.Mode())
+        # Nothing was moved and no header was added or removed, so the file is
+        # already ordered and the comparatively slow black pass can be skipped.
+        if reordered_code == original_source_code:
+            return reordered_code
+
+        reordered_code = black.format_str(reordered_code, mode=BLACK_MODE)
 
         return reordered_code
 
+    def _should_format(self, filename: str) -> bool:
+        """
+        Checks whether the file is a frontend or test file handled by this formatter.
+
+        Parameters
+        ----------
+        filename 
+            The path to the Python file.
+
+        Returns
+        -------
+        True if the path matches `FILE_PATTERN`, False otherwise.
+        """
+        return (
+            filename.startswith(FILE_PREFIXES)
+            and not filename.endswith("/__init__.py")
+            and FILE_PATTERN.match(filename) is not None
+        )
+
     def _format_file(self, filename: str) -> bool:
         """
         Formats the content of a Python file by reordering functions and classes.
 
+        Only called by `format` for files accepted by `_should_format`.
+
         Parameters
         ----------
         filename 
@@ -547,11 +582,8 @@ class FunctionOrderingFormatter(BaseFormatter):
 
         Returns
         -------
-        True if formatting is successful, False otherwise.
+        True if the file was changed, False otherwise.
         """
-        if FILE_PATTERN.match(filename) is None:
-            return False
-
         try:
             with open(filename, "r", encoding="utf-8") as f:
                 original_code = f.read()
@@ -559,11 +591,24 @@ class FunctionOrderingFormatter(BaseFormatter):
             if not original_code.strip():
                 return False
 
+            # Skip files a previous run found to be formatted in their current state
+            if is_marked_formatted(filename, original_code):
+                return False
+
             reordered_code = self._rearrange_functions_and_classes(original_code)
 
+            # Leave already formatted files untouched so their mtime is preserved.
+            # Only a pass that changes nothing shows the file is stable, since a
+            # single pass does not always reach a fixed point.
+            if reordered_code == original_code:
+                mark_formatted(filename, original_code)
+                return False
+
             with open(filename, "w", encoding="utf-8") as f:
                 f.write(reordered_code)
 
+            return True
+
         except SyntaxError:
             print(
                 f"Error: The provided file '{filename}' does not contain valid Python"
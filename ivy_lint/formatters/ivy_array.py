@@ -1,12 +1,23 @@
 """Docstring formatter for fixing ivy.array output style."""
 
 import re
+from functools import lru_cache
 
 import black
 
 from ivy_lint.formatters import BaseDocstringFormatter
 from ivy_lint.strings import find_closing_parentheses
 
+BLACK_MODE = black.Mode(line_length=50)
+# An example input line followed by its continuation lines
+INPUT_BLOCK_PATTERN = re.compile(r"(^>>> .*\n(\.\.\. .*\n)*)", re.MULTILINE)
+
+
+@lru_cache(maxsize=None)
+def _indented_newline(indent: int) -> str:
+    """Return a newline followed by `indent` spaces, shared across calls."""
+    return "\n" + indent * " "
+
 
 class IvyArrayDocstringFormatter(BaseDocstringFormatter):
     """
@@ -21,7 +32,7 @@ class IvyArrayDocstringFormatter(BaseDocstringFormatter):
             return super()._do_format_section(section)
 
         # Split on inputs
-        partitions = re.split(r"(^>>> .*\n(\.\.\. .*\n)*)", section, flags=re.MULTILINE)
+        partitions = INPUT_BLOCK_PATTERN.split(section)
 
         # Partitions should looke like
         # [title block, input block, remaining input, output block, ...]
@@ -50,14 +61,14 @@ class IvyArrayDocstringFormatter(BaseDocstringFormatter):
                 pointer = closing + 1
 
                 code = black.format_str(
-                    partitions[i][found : closing + 1], mode=black.Mode(line_length=50)
+                    partitions[i][found : closing + 1], mode=BLACK_MODE
                 ).strip()
 
                 if "\n" in code:
                     # Find how many characters from the start of the line to found
                     # This is used to indent the code
                     indent = found - partitions[i].rfind("\n", 0, found) - 1
-                    code = code.replace("\n", "\n" + indent * " ")
+                    code = code.replace("\n", _indented_newline(indent))
 
                 new_output_parts.append(code)
 
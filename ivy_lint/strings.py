@@ -18,14 +18,20 @@ def find_closing_parentheses(string: str, start: int) -> int:
     end: int
         The index of the closing parentheses.
     """
+    # Jump between parentheses with str.find, each search resumes after the
+    # previous hit of the same kind so the string is scanned only once
     count = 1
-    for i in range(start + 1, len(string)):
-        if string[i] == "(":
+    next_open = string.find("(", start + 1)
+    next_close = string.find(")", start + 1)
+    while next_close != -1:
+        if next_open != -1 and next_open < next_close:
             count += 1
-        elif string[i] == ")":
+            next_open = string.find("(", next_open + 1)
+        else:
             count -= 1
             if count == 0:
-                return i
+                return next_close
+            next_close = string.find(")", next_close + 1)
 
     start_line = string.rfind("\n", 0, start)
     end_line = string.find("\n", start)